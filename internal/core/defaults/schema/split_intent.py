@@ -1,5 +1,9 @@
 #!/usr/bin/env python3
+import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
+
+SECTION_HEADER_RE = re.compile(r'^# ====.*\n# SECTION.*', re.MULTILINE)
 
 def read_file(filename):
     with open(filename, 'r', encoding='utf-8') as f:
@@ -15,112 +19,107 @@ def extract_sections_by_category(lines):
         'multistep_corpus': []
     }
     
-    current_section = None
-    current_section_lines = []
-    section_category = None
-    
-    i = 0
-    while i < len(lines):
-        line = lines[i]
-        
-        if i < 14:
-            i += 1
-            continue
-        
-        if line.startswith('# ====') and i + 1 < len(lines) and lines[i+1].startswith('# SECTION'):
-            if current_section and current_section_lines and section_category:
-                result[section_category].append((current_section, current_section_lines))
-            
-            current_section = lines[i+1].rstrip()
-            current_section_lines = [line, lines[i+1]]
-            
-            if 'CAMPAIGN' in current_section:
-                section_category = 'campaign'
-            elif 'MULTI-STEP TASK PATTERNS' in current_section:
-                section_category = 'multistep_patterns'
-            elif 'ENCYCLOPEDIC MULTI-STEP' in current_section:
-                section_category = 'multistep_corpus'
-            elif 'CONFIGURATION' in current_section:
+    # Prefix counts of marker lines, so classifying a section is O(1)
+    # instead of re-scanning the next 100 lines at every header.
+    pq = [0] * (len(lines) + 1)
+    pm = [0] * (len(lines) + 1)
+    pi = [0] * (len(lines) + 1)
+    for n, l in enumerate(lines):
+        pq[n + 1] = pq[n] + ('/query' in l)
+        pm[n + 1] = pm[n] + ('/mutation' in l)
+        pi[n + 1] = pi[n] + ('/instruction' in l)
+
+    # Locate every "# ====" / "# SECTION" header pair in one regex scan
+    # over the whole file rather than testing each line in Python.
+    # The first 14 lines are the file preamble, so the scan starts after them.
+    text = ''.join(lines)
+    headers = []
+    line_no = min(14, len(lines))
+    pos = sum(map(len, lines[:line_no]))
+    for m in SECTION_HEADER_RE.finditer(text, pos):
+        line_no += text.count('\n', pos, m.start())
+        pos = m.start()
+        headers.append(line_no)
+
+    for k, i in enumerate(headers):
+        current_section = lines[i+1].rstrip()
+        end = headers[k+1] if k + 1 < len(headers) else len(lines)
+
+        if 'CAMPAIGN' in current_section:
+            section_category = 'campaign'
+        elif 'MULTI-STEP TASK PATTERNS' in current_section:
+            section_category = 'multistep_patterns'
+        elif 'ENCYCLOPEDIC MULTI-STEP' in current_section:
+            section_category = 'multistep_corpus'
+        elif 'CONFIGURATION' in current_section:
+            section_category = 'instruction'
+        else:
+            j = min(i+100, len(lines))
+            query_count = pq[j] - pq[i]
+            mutation_count = pm[j] - pm[i]
+            instruction_count = pi[j] - pi[i]
+
+            if instruction_count > 0:
                 section_category = 'instruction'
+            elif mutation_count > query_count:
+                section_category = 'mutation'
             else:
-                query_count = sum(1 for l in lines[i:min(i+100, len(lines))] if '/query' in l)
-                mutation_count = sum(1 for l in lines[i:min(i+100, len(lines))] if '/mutation' in l)
-                instruction_count = sum(1 for l in lines[i:min(i+100, len(lines))] if '/instruction' in l)
-                
-                if instruction_count > 0:
-                    section_category = 'instruction'
-                elif mutation_count > query_count:
-                    section_category = 'mutation'
-                else:
-                    section_category = 'query'
-            
-            i += 2
-            continue
-        
-        if current_section:
-            current_section_lines.append(line)
-        
-        i += 1
-    
-    if current_section and current_section_lines and section_category:
-        result[section_category].append((current_section, current_section_lines))
-    
+                section_category = 'query'
+
+        result[section_category].append((current_section, lines[i:end]))
+
     return result
 
+def section_chunks(header, secs):
+    # Gather every line up front so each file is written with a single
+    # writelines call instead of joining and writing per section.
+    chunks = [header]
+    for _, sec_lines in secs:
+        chunks.extend(sec_lines)
+        chunks.append('\n')
+    return chunks
+
+def write_chunks(filename, chunks, encoding=None):
+    with open(filename, 'w', encoding=encoding) as f:
+        f.writelines(chunks)
+
 lines = read_file('intent.mg')
 sections = extract_sections_by_category(lines)
 
 # Core
-with open('intent_core.mg', 'w', encoding='utf-8') as f:
-    f.write("# Intent Core - Decl statements\n\n")
-    for i in range(11, 14):
-        if i < len(lines) and lines[i].strip():
-            f.write(lines[i])
-    f.write('\n')
-    for i, line in enumerate(lines):
-        if i >= 1820 and i <= 1830 and 'Decl multistep' in line:
-            f.write(line)
-        elif i >= 2370 and i <= 2400 and 'Decl ' in line:
-            f.write(line)
-
-# Queries
-with open('intent_queries.mg', 'w') as f:
-    f.write("# Intent Queries\n\n")
-    for _, sec_lines in sections['query']:
-        f.write(''.join(sec_lines))
-        f.write('\n')
-
-# Mutations
-with open('intent_mutations.mg', 'w') as f:
-    f.write("# Intent Mutations\n\n")
-    for _, sec_lines in sections['mutation']:
-        f.write(''.join(sec_lines))
-        f.write('\n')
-
-# Instructions
-with open('intent_instructions.mg', 'w') as f:
-    f.write("# Intent Instructions\n\n")
-    for _, sec_lines in sections['instruction']:
-        f.write(''.join(sec_lines))
-        f.write('\n')
-
-# Campaign
-with open('intent_campaign.mg', 'w') as f:
-    f.write("# Intent Campaign\n\n")
-    all_campaign = sections['campaign'] + sections['multistep_patterns'] + sections['multistep_corpus']
-    for _, sec_lines in all_campaign:
-        f.write(''.join(sec_lines))
-        f.write('\n')
-
-# System
-with open('intent_system.mg', 'w') as f:
-    f.write("""# Intent System - Inference Rules
+core = ["# Intent Core - Decl statements\n\n"]
+for i in range(11, 14):
+    if i < len(lines) and lines[i].strip():
+        core.append(lines[i])
+core.append('\n')
+for i, line in enumerate(lines):
+    if i >= 1820 and i <= 1830 and 'Decl multistep' in line:
+        core.append(line)
+    elif i >= 2370 and i <= 2400 and 'Decl ' in line:
+        core.append(line)
+
+all_campaign = sections['campaign'] + sections['multistep_patterns'] + sections['multistep_corpus']
+
+system = ["""# Intent System - Inference Rules
 
 pattern_verb_pair(Pattern, Verb1, Verb2) :-
     multistep_verb_pair(Pattern, Verb1, Verb2).
 
 pattern_relation(Pattern, Relation) :-
     multistep_pattern(Pattern, _, Relation, _).
-""")
+"""]
+
+jobs = [
+    ('intent_core.mg', core, 'utf-8'),
+    ('intent_queries.mg', section_chunks("# Intent Queries\n\n", sections['query'])),
+    ('intent_mutations.mg', section_chunks("# Intent Mutations\n\n", sections['mutation'])),
+    ('intent_instructions.mg', section_chunks("# Intent Instructions\n\n", sections['instruction'])),
+    ('intent_campaign.mg', section_chunks("# Intent Campaign\n\n", all_campaign)),
+    ('intent_system.mg', system),
+]
+
+# The six outputs are independent, so write them concurrently.
+with ThreadPoolExecutor(max_workers=len(jobs)) as pool:
+    list(pool.map(lambda job: write_chunks(*job), jobs))
 
 print("Created all 6 modular files")